@@ -12,24 +12,67 @@ Usage:
     # Serve F-12 at 10x speed:
     python scripts/volve_wits_server.py --file data/volve/F-12_witsml.csv --speed 10
 
+    # Serve F-12 at 1000x speed, coalescing 50 records per socket write:
+    python scripts/volve_wits_server.py --file data/volve/F-12_witsml.csv --speed 1000 --batch 50
+
     # Serve F-5 on custom port:
     python scripts/volve_wits_server.py --file data/volve/F-5_witsml.csv --port 10002
 
     # List available wells:
     python scripts/volve_wits_server.py --list
+
+Requires numpy. pyarrow (preferred), pandas or numba are used for a fast CSV
+load when installed; without them the server falls back to csv.reader, which
+uses fastnumbers for cell parsing if available. The server runs on uvloop
+when it is installed.
 """
 
 import argparse
 import asyncio
 import csv
 import glob
+import mmap
+import operator
 import os
 import signal
+import socket
 import sys
 import time
+from array import array
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+except ImportError:
+    pa = None
+    pv = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    from fastnumbers import fast_float, try_float
+except ImportError:
+    fast_float = None
+    try_float = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # ============================================================================
 # Unit conversions (metric -> oilfield, matching src/volve.rs)
@@ -45,10 +88,14 @@ GCM3_TO_PPG = 8.34540        # grams/cm3 -> pounds/gallon
 M3_TO_BBL = 6.28981          # cubic metres -> barrels
 
 
-def celsius_to_fahrenheit(c: float) -> float:
-    if c == 0.0:
-        return 0.0
-    return c * 9.0 / 5.0 + 32.0
+def celsius_to_fahrenheit(c: np.ndarray) -> np.ndarray:
+    """Vectorized degC -> degF.
+
+    0.0 means "no reading" and stays 0.0 rather than becoming 32 degF,
+    matching src/volve.rs; missing (NaN) cells stay NaN. The c * 9 / 5 form
+    is kept so values are bit-identical to the Rust replay.
+    """
+    return np.where(c == 0.0, 0.0, c * 9.0 / 5.0 + 32.0)
 
 
 # ============================================================================
@@ -149,160 +196,596 @@ def map_columns(header: list[str]) -> ColumnMap:
     return m
 
 
-def safe_float(fields: list[str], idx: int) -> float:
-    """Extract float from CSV field, returning 0.0 for missing/NaN."""
+# Cell values treated as a missing sensor reading (blank cells included)
+NULL_TOKENS = ["", "nan", "null", "-"]
+
+# Cells converted per _parse_cells call in the pure-Python reader
+PARSE_CHUNK_CELLS = 1 << 20
+
+
+def safe_float(fields: Sequence[str | bytes], idx: int, missing: float = 0.0) -> float:
+    """Extract float from CSV field, returning missing (0.0) for missing/NaN."""
+    if fast_float is not None:
+        # One C call: blanks, NaN literals and junk all map to missing, no exceptions
+        return fast_float(fields[idx] if 0 <= idx < len(fields) else "",
+                          on_fail=missing, nan=missing)
     if idx < 0 or idx >= len(fields):
-        return 0.0
+        return missing
     s = fields[idx].strip()
     if not s or s.lower() in ("nan", "null", "-", ""):
-        return 0.0
+        return missing
     try:
         v = float(s)
         if v != v:  # NaN check
-            return 0.0
+            return missing
         return v
     except ValueError:
-        return 0.0
+        return missing
 
 
 # ============================================================================
 # Data loading
 # ============================================================================
 
-@dataclass
-class WitsRecord:
-    """A single drilling data record in oilfield units, ready for WITS0 framing."""
-    bit_depth: float = 0.0      # ft
-    hole_depth: float = 0.0     # ft
-    wob: float = 0.0            # klbs
-    torque: float = 0.0         # kft-lbs
-    rpm: float = 0.0            # RPM
-    rop: float = 0.0            # ft/hr
-    hook_load: float = 0.0      # klbs
-    spp: float = 0.0            # psi
-    flow_in: float = 0.0        # gpm
-    mw_in: float = 0.0          # ppg
-    mw_out: float = 0.0         # ppg
-    ecd: float = 0.0            # ppg
-    temp_in: float = 0.0        # degF
-    temp_out: float = 0.0       # degF
-    gas: float = 0.0            # %
-    pump_spm: float = 0.0       # 1/min
-    pit_volume: float = 0.0     # bbl
-    block_pos: float = 0.0      # ft
-
-    def to_wits_frame(self) -> bytes:
-        """Build a WITS Level 0 frame (&&...!! delimited)."""
-        lines = ["&&"]
-        items = [
-            (WITS_BIT_DEPTH,  self.bit_depth),
-            (WITS_HOLE_DEPTH, self.hole_depth),
-            (WITS_ROP,        self.rop),
-            (WITS_HOOK_LOAD,  self.hook_load),
-            (WITS_WOB,        self.wob),
-            (WITS_RPM,        self.rpm),
-            (WITS_TORQUE,     self.torque),
-            (WITS_SPP,        self.spp),
-            (WITS_PUMP_SPM,   self.pump_spm),
-            (WITS_FLOW_IN,    self.flow_in),
-            (WITS_MW_IN,      self.mw_in),
-            (WITS_MW_OUT,     self.mw_out),
-            (WITS_ECD,        self.ecd),
-            (WITS_TEMP_IN,    self.temp_in),
-            (WITS_TEMP_OUT,   self.temp_out),
-            (WITS_GAS,        self.gas),
-            (WITS_PIT_VOL,    self.pit_volume),
-            (WITS_BLOCK_POS,  self.block_pos),
-        ]
-        for code, value in items:
-            lines.append(f"{code}{value:.2f}")
-        lines.append("!!")
-        return ("\r\n".join(lines) + "\r\n").encode("ascii")
-
-
-def load_csv(filepath: str) -> list[WitsRecord]:
-    """Load a Volve Kaggle-format CSV and convert to oilfield-unit WitsRecords."""
-    records = []
-    skipped = 0
+class WitsRecord(NamedTuple):
+    """A single drilling data record in oilfield units, in WITS0 frame order.
+
+    Loaded wells are stored as one (N, len(WitsRecord._fields)) float64
+    array rather than N records; the field positions here are the column
+    indices (see COL).
+    """
+    bit_depth: float            # ft
+    hole_depth: float           # ft
+    rop: float                  # ft/hr
+    hook_load: float            # klbs
+    wob: float                  # klbs
+    rpm: float                  # RPM
+    torque: float               # kft-lbs
+    spp: float                  # psi
+    pump_spm: float             # 1/min
+    flow_in: float              # gpm
+    mw_in: float                # ppg
+    mw_out: float               # ppg
+    ecd: float                  # ppg
+    temp_in: float              # degF
+    temp_out: float             # degF
+    gas: float                  # %
+    pit_volume: float           # bbl
+    block_pos: float            # ft
+
+
+# Column index of each field in the loaded data array, e.g. data[:, COL.rpm]
+COL = WitsRecord(*range(len(WitsRecord._fields)))
+
+# WITS item code for each data column
+WITS_CODES = WitsRecord(
+    bit_depth=WITS_BIT_DEPTH, hole_depth=WITS_HOLE_DEPTH, rop=WITS_ROP,
+    hook_load=WITS_HOOK_LOAD, wob=WITS_WOB, rpm=WITS_RPM, torque=WITS_TORQUE,
+    spp=WITS_SPP, pump_spm=WITS_PUMP_SPM, flow_in=WITS_FLOW_IN, mw_in=WITS_MW_IN,
+    mw_out=WITS_MW_OUT, ecd=WITS_ECD, temp_in=WITS_TEMP_IN, temp_out=WITS_TEMP_OUT,
+    gas=WITS_GAS, pit_volume=WITS_PIT_VOL, block_pos=WITS_BLOCK_POS,
+)
+
+
+# Per-column bytes %-templates: formatting goes straight to bytes
+CHANNEL_TEMPLATES = tuple(f"{code}%.2f\r\n".encode("ascii") for code in WITS_CODES)
+FRAME_HEAD = b"&&\r\n"
+FRAME_TAIL = b"!!\r\n"
+
+# Rows formatted per whole-frame % call in encode_frames
+ENCODE_CHUNK_ROWS = 65536
+
+
+def channel_templates(data: np.ndarray) -> tuple[bytes, ...]:
+    """Pick a template per column of data.
+
+    Columns holding only whole numbers (RPM, SPM, ...) use %d, which skips
+    float rounding and 3 bytes per value; the rest keep CHANNEL_TEMPLATES.
+    Missing (NaN) cells are never formatted, so they don't count.
+    """
+    whole = np.where(np.isnan(data), True,
+                     np.isfinite(data) & (data == np.trunc(data))).all(axis=0)
+    return tuple(f"{code}%d\r\n".encode("ascii") if is_whole else tpl
+                 for code, is_whole, tpl in zip(WITS_CODES, whole, CHANNEL_TEMPLATES))
+
+
+def frame_template(templates: tuple[bytes, ...], channels: Sequence[int]) -> bytes:
+    """Whole-frame % template carrying only the given channel indices."""
+    return FRAME_HEAD + b"".join([templates[k] for k in channels]) + FRAME_TAIL
+
+
+def encode_frames(data: np.ndarray) -> tuple[bytes, np.ndarray]:
+    """Format every row of data into one contiguous buffer of WITS0 frames.
+
+    Returns (buf, offsets); frame i is buf[offsets[i]:offsets[i + 1]].
+    Missing (NaN) channels are left out of their frame. Runs of rows with
+    the same channels present are formatted a chunk at a time with a single
+    bytes % call over a repeated whole-frame template, so no Python code
+    runs per value.
+    """
+    templates = channel_templates(data)
+    # Presence bitmap: bit k of masks[i] is set when row i has channel k
+    present = ~np.isnan(data)
+    masks = present @ (1 << np.arange(len(COL), dtype=np.int64))
+    run_starts = np.flatnonzero(np.diff(masks, prepend=-1))
+    run_ends = np.append(run_starts[1:], len(data))
+
+    buf = bytearray()
+    frames: dict[int, tuple[bytes, np.ndarray]] = {}
+    for run_start, run_end, mask in zip(run_starts.tolist(), run_ends.tolist(),
+                                        masks[run_starts].tolist()):
+        if mask not in frames:
+            channels = np.flatnonzero(present[run_start])
+            frames[mask] = frame_template(templates, channels.tolist()), channels
+        template, channels = frames[mask]
+        for start in range(run_start, run_end, ENCODE_CHUNK_ROWS):
+            chunk = data[start:min(run_end, start + ENCODE_CHUNK_ROWS), channels]
+            buf += (template * len(chunk)) % tuple(chunk.ravel().tolist())
+
+    # '!' only occurs in the "!!" trailer; every second one ends a frame at +3
+    bangs = np.flatnonzero(np.frombuffer(buf, dtype=np.uint8) == ord("!"))
+    offsets = np.zeros(len(data) + 1, dtype=np.int64)
+    offsets[1:] = bangs[1::2] + 3
+    return bytes(buf), offsets
+
+
+def load_csv(filepath: str) -> "np.ndarray":
+    """Load a Volve Kaggle-format CSV into an (N, 18) oilfield-unit array.
+
+    Columns follow WitsRecord field order; channels with no value in the
+    CSV are NaN. All-zero sensor-gap rows are dropped.
+    """
+    if os.path.getsize(filepath) == 0:
+        return np.empty((0, len(COL)))
+
+    readers = ((pv, _read_columns_arrow), (pd, _read_columns_pandas),
+               (njit, _read_columns_numba))
+    for available, reader in readers:
+        if available is None:
+            continue
+        try:
+            raw = reader(filepath)
+        except ValueError:
+            # Ragged rows etc. (ArrowInvalid and pandas' ParserError are both
+            # ValueErrors) -- fall through to a more forgiving reader
+            continue
+        if raw is not None:
+            return _to_oilfield(raw)
+    return _to_oilfield(_read_rows_csv(filepath))
+
+
+# Bump whenever load_csv's output changes so existing caches are ignored
+CACHE_VERSION = 4
+
+
+def cache_path(filepath: str) -> str:
+    """Parsed-array cache file for filepath, keyed by its mtime and size."""
+    st = os.stat(filepath)
+    return f"{filepath}.v{CACHE_VERSION}.{st.st_mtime_ns}.{st.st_size}.npy"
+
+
+def load_well(filepath: str, use_cache: bool = True) -> tuple[np.ndarray, bool]:
+    """load_csv through a .npy cache next to the CSV; returns (data, cache_hit).
+
+    A cache hit is memory-mapped read-only, so start-up skips CSV parsing
+    entirely. Touching or editing the CSV changes the cache key; stale
+    caches for the same CSV are removed when a new one is written.
+    """
+    if not use_cache:
+        return load_csv(filepath), False
+
+    path = cache_path(filepath)
+    try:
+        data = np.load(path, mmap_mode="r")
+        if data.ndim == 2 and data.shape[1] == len(COL) and data.dtype == np.float64:
+            return data, True
+    except (OSError, ValueError):
+        pass
+
+    data = load_csv(filepath)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            np.save(f, data)
+        os.replace(tmp, path)
+        for stale in glob.glob(glob.escape(filepath) + ".v*.npy"):
+            if stale != path:
+                os.remove(stale)
+    except OSError:
+        # Read-only data dir etc. -- run uncached
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return data, False
+
+
+def column_indices(col: ColumnMap) -> np.ndarray:
+    """CSV column index of each WitsRecord field (-1 = not in the file).
+
+    Readers index with this int32 array directly instead of 18 getattr
+    calls on the ColumnMap.
+    """
+    return np.fromiter((getattr(col, name) for name in WitsRecord._fields),
+                       dtype=np.int32, count=len(COL))
+
+
+def _read_column_indices(filepath: str) -> tuple[int, np.ndarray]:
+    """Read only the header line; returns (column count, column_indices)."""
+    with open(filepath, "r", newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), [])
+    return len(header), column_indices(map_columns(header))
+
+
+def _read_columns_arrow(filepath: str) -> "np.ndarray":
+    """Parse the mapped columns with pyarrow's multi-threaded C++ CSV reader.
+
+    Returns the raw metric (N, 18) float64 array in WitsRecord field order,
+    with NaN for missing cells.
+    """
+    ncols, col_idx = _read_column_indices(filepath)
+    present = np.flatnonzero(col_idx >= 0)
+    # Positional names sidestep duplicate/BOM-prefixed header text
+    names = [f"c{i}" for i in range(ncols)]
+    wanted = {f"c{col_idx[k]}": k for k in present}
+
+    table = pv.read_csv(
+        filepath,
+        read_options=pv.ReadOptions(use_threads=True, block_size=8 << 20,
+                                    skip_rows=1, column_names=names),
+        convert_options=pv.ConvertOptions(include_columns=list(wanted),
+                                          null_values=NULL_TOKENS,
+                                          strings_can_be_null=True),
+    )
+
+    raw = np.full((table.num_rows, len(COL)), np.nan)
+    for key, k in wanted.items():
+        column = table.column(key)
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            # Non-numeric junk in a sensor column counts as missing, like safe_float
+            raw[:, k] = [safe_float([s or ""], 0, np.nan) for s in column.to_pylist()]
+        else:
+            raw[:, k] = column.cast(pa.float64()).to_numpy(zero_copy_only=False)
+    return raw
+
+
+def _read_columns_pandas(filepath: str) -> "np.ndarray":
+    """Parse the mapped columns with pandas' C engine (see _read_columns_arrow)."""
+    _, col_idx = _read_column_indices(filepath)
+    present = np.flatnonzero(col_idx >= 0)
+    usecols = col_idx[present].tolist()
+
+    try:
+        df = pd.read_csv(filepath, header=None, skiprows=1, usecols=usecols,
+                         na_values=NULL_TOKENS, encoding="utf-8-sig", engine="c")
+    except pd.errors.EmptyDataError:  # header-only file
+        return np.empty((0, len(COL)))
+    # Non-numeric junk in a sensor column counts as missing, like safe_float
+    df = df.apply(pd.to_numeric, errors="coerce")
+
+    raw = np.full((len(df), len(COL)), np.nan)
+    raw[:, present] = df[usecols].to_numpy(dtype=np.float64)
+    return raw
+
+
+def _read_rows_csv(filepath: str) -> "np.ndarray":
+    """Pure-Python parse, used when no compiled reader is available.
+
+    Mapped cells are picked per row with one itemgetter call and converted
+    in bulk by _parse_cells.
+    """
+    ncols, col_idx = _read_column_indices(filepath)
+    # Unmapped fields read the blank sentinel appended to every row (index -1)
+    pick = operator.itemgetter(*col_idx.tolist())
+    pad = [""] * (ncols + 1)
+
+    values = array("d")
+    cells = []
+    for fields in _iter_rows(filepath):
+        fields += pad[len(fields):] if len(fields) < ncols else pad[:1]
+        cells.extend(pick(fields))
+        if len(cells) >= PARSE_CHUNK_CELLS:
+            values.extend(_parse_cells(cells))
+            cells = []
+    values.extend(_parse_cells(cells))
+
+    return np.frombuffer(values, dtype=np.float64).reshape(-1, len(COL))
+
+
+def _iter_rows(filepath: str):
+    """Yield the split data rows of a CSV, skipping the header and blank rows.
+
+    Lines come from an mmap (memchr newline scan, fields stay bytes with no
+    text decoding); files with quoted fields go through csv.reader instead.
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'"') == -1:
+                mm.readline()
+                for line in iter(mm.readline, b""):
+                    if line.strip(b" \t\r\n,"):
+                        yield line.rstrip(b"\r\n").split(b",")
+                return
 
     with open(filepath, "r", newline="", encoding="utf-8-sig") as f:
         reader = csv.reader(f)
-        header = next(reader)
-        col = map_columns(header)
-
-        for row_num, fields in enumerate(reader, start=2):
-            if not fields or all(f.strip() == "" for f in fields):
-                continue
-
-            # Read raw metric values
-            raw_depth     = safe_float(fields, col.bit_depth)
-            raw_hole      = safe_float(fields, col.hole_depth)
-            raw_wob       = safe_float(fields, col.wob)
-            raw_torque    = safe_float(fields, col.torque)
-            raw_rpm       = safe_float(fields, col.rpm)
-            raw_rop       = safe_float(fields, col.rop)
-            raw_hookload  = safe_float(fields, col.hook_load)
-            raw_spp       = safe_float(fields, col.spp)
-            raw_flow_in   = safe_float(fields, col.flow_in)
-            raw_mw_in     = safe_float(fields, col.mw_in)
-            raw_mw_out    = safe_float(fields, col.mw_out)
-            raw_ecd       = safe_float(fields, col.ecd)
-            raw_temp_in   = safe_float(fields, col.temp_in)
-            raw_temp_out  = safe_float(fields, col.temp_out)
-            raw_gas       = safe_float(fields, col.gas)
-            raw_pump_spm  = safe_float(fields, col.pump_spm)
-            raw_pit_vol   = safe_float(fields, col.pit_volume)
-            raw_block_pos = safe_float(fields, col.block_pos)
-
-            # Skip all-zero rows (sensor feed gaps)
-            if (abs(raw_wob) < 1e-10 and abs(raw_rpm) < 1e-10 and
-                abs(raw_rop) < 1e-10 and abs(raw_spp) < 1e-10 and
-                abs(raw_depth) < 1e-10):
-                skipped += 1
-                continue
-
-            # Convert metric -> oilfield
-            rec = WitsRecord(
-                bit_depth  = raw_depth * M_TO_FT,
-                hole_depth = (raw_hole if raw_hole else raw_depth) * M_TO_FT,
-                wob        = raw_wob * KKGF_TO_KLBF,
-                torque     = raw_torque * KNM_TO_KFTLB,
-                rpm        = raw_rpm,
-                rop        = raw_rop * MH_TO_FTHR,
-                hook_load  = raw_hookload * KKGF_TO_KLBF,
-                spp        = raw_spp * KPA_TO_PSI,
-                flow_in    = raw_flow_in * LMIN_TO_GPM,
-                mw_in      = raw_mw_in * GCM3_TO_PPG,
-                mw_out     = raw_mw_out * GCM3_TO_PPG,
-                ecd        = raw_ecd * GCM3_TO_PPG,
-                temp_in    = celsius_to_fahrenheit(raw_temp_in),
-                temp_out   = celsius_to_fahrenheit(raw_temp_out),
-                gas        = raw_gas,
-                pump_spm   = raw_pump_spm,
-                pit_volume = raw_pit_vol * M3_TO_BBL,
-                block_pos  = raw_block_pos * M_TO_FT,
-            )
-            records.append(rec)
-
-    return records
+        next(reader, None)
+        for fields in reader:
+            if fields and not all(f.strip() == "" for f in fields):
+                yield fields
+
+
+def _parse_cells(cells: list) -> list[float]:
+    """safe_float over a flat list of cells (missing -> NaN), in one C call
+    with fastnumbers."""
+    if try_float is not None:
+        return try_float(cells, on_fail=np.nan, nan=np.nan, map=list)
+    return [safe_float((cell,), 0, np.nan) for cell in cells]
+
+
+def _read_columns_numba(filepath: str) -> "np.ndarray | None":
+    """Parse the mapped columns with the numba-compiled _decode_csv kernel.
+
+    The file is memory-mapped and scanned as raw bytes, so no Python code
+    runs per cell. Returns None for quoted CSVs, which the kernel does not
+    tokenize.
+    """
+    ncols, col_idx = _read_column_indices(filepath)
+    present = np.flatnonzero(col_idx >= 0)
+    # Inverse of col_idx: file column -> data column (or -1 for unmapped columns)
+    col_map = np.full(ncols, -1, dtype=np.int64)
+    col_map[col_idx[present]] = present
+
+    if os.path.getsize(filepath) == 0:
+        return np.empty((0, len(COL)))
+    buf = np.memmap(filepath, dtype=np.uint8, mode="r")
+    quoted, raw, slow = _decode_csv(buf, col_map, len(COL))
+    if quoted:
+        return None
+    # Cells outside the exact fast path (very long mantissas/exponents)
+    for row, k, start, end in slow.tolist():
+        raw[row, k] = safe_float([bytes(buf[start:end]).decode("ascii", "replace")], 0)
+    return raw
+
+
+# Exact powers of ten for the Clinger fast path (10**22 is the largest exact double)
+_POW10 = np.array([10.0 ** i for i in range(23)])
+
+# _parse_double status codes
+_PARSE_OK = 0
+_PARSE_MISSING = 1
+_PARSE_SLOW = 2
+
+
+def _parse_double(buf, start, end):
+    """Parse the ASCII decimal in buf[start:end]; returns (value, status).
+
+    Accepts [+-]digits[.digits][(e|E)[+-]digits] with surrounding blanks.
+    Blank or non-numeric cells (inf/nan literals included) give
+    (NaN, _PARSE_MISSING). Numbers with more than 18 digits, a mantissa
+    above 2**53 or a decimal exponent beyond +/-22 give _PARSE_SLOW so the
+    caller can re-parse them exactly with float().
+    """
+    while start < end and (buf[start] == 32 or buf[start] == 9):
+        start += 1
+    while end > start and (buf[end - 1] == 32 or buf[end - 1] == 9 or buf[end - 1] == 13):
+        end -= 1
+
+    neg = False
+    if start < end and (buf[start] == 45 or buf[start] == 43):
+        neg = buf[start] == 45
+        start += 1
+
+    # Integer fast path: RPM, SPM etc. are mostly plain digit runs. Up to 18
+    # digits fit an int64, and int -> float conversion is correctly rounded.
+    acc = 0
+    pos = start
+    while pos < end and 48 <= buf[pos] <= 57:
+        acc = acc * 10 + (buf[pos] - 48)
+        pos += 1
+    if pos == end and 0 < end - start <= 18:
+        value = float(acc)
+        return -value if neg else value, _PARSE_OK
+    return _parse_decimal(buf, start, end, neg)
+
+
+def _parse_decimal(buf, start, end, neg):
+    """Decimal/exponent path of _parse_double; buf[start:end] is trimmed and unsigned."""
+    mantissa = 0
+    digits = 0
+    exp10 = 0
+    pos = start
+    while pos < end and 48 <= buf[pos] <= 57:
+        if digits < 18:
+            mantissa = mantissa * 10 + (buf[pos] - 48)
+        else:
+            exp10 += 1
+        digits += 1
+        pos += 1
+    if pos < end and buf[pos] == 46:
+        pos += 1
+        while pos < end and 48 <= buf[pos] <= 57:
+            if digits < 18:
+                mantissa = mantissa * 10 + (buf[pos] - 48)
+                exp10 -= 1
+            digits += 1
+            pos += 1
+    if digits == 0:
+        return np.nan, _PARSE_MISSING
+
+    if pos < end and (buf[pos] == 101 or buf[pos] == 69):
+        pos += 1
+        exp_neg = False
+        if pos < end and (buf[pos] == 45 or buf[pos] == 43):
+            exp_neg = buf[pos] == 45
+            pos += 1
+        exp_digits = 0
+        exp = 0
+        while pos < end and 48 <= buf[pos] <= 57:
+            if exp < 100000:
+                exp = exp * 10 + (buf[pos] - 48)
+            exp_digits += 1
+            pos += 1
+        if exp_digits == 0:
+            return np.nan, _PARSE_MISSING
+        exp10 += -exp if exp_neg else exp
+    if pos != end:
+        return np.nan, _PARSE_MISSING
+
+    if digits > 18 or mantissa > (1 << 53) or exp10 < -22 or exp10 > 22:
+        if mantissa == 0:
+            return -0.0 if neg else 0.0, _PARSE_OK
+        return np.nan, _PARSE_SLOW
+    value = float(mantissa)
+    if exp10 < 0:
+        value /= _POW10[-exp10]
+    else:
+        value *= _POW10[exp10]
+    return -value if neg else value, _PARSE_OK
+
+
+def _decode_csv(buf, col_map, width):
+    """Tokenize the data rows of a CSV byte buffer into an (N, width) array.
+
+    The header line is skipped, as are blank lines. col_map[i] is the
+    output column for file column i (-1 = skip). Returns (quoted, values,
+    slow): quoted is True (and nothing is parsed) if the file contains a
+    '"', and slow holds (row, column, start, end) for cells that need an
+    exact re-parse.
+    """
+    n = len(buf)
+    pos = n
+    max_rows = 1
+    for i in range(n):
+        c = buf[i]
+        if c == 10:
+            if pos == n:
+                pos = i + 1
+            max_rows += 1
+        elif c == 34:
+            return True, np.empty((0, width)), np.empty((0, 4), dtype=np.int64)
+    out = np.full((max_rows, width), np.nan)
+    slow = np.empty((16, 4), dtype=np.int64)
+    nslow = 0
+
+    row = 0
+    while pos < n:
+        eol = pos
+        while eol < n and buf[eol] != 10:
+            eol += 1
+        line_end = eol
+        if line_end > pos and buf[line_end - 1] == 13:
+            line_end -= 1
+
+        if line_end > pos:
+            field = 0
+            start = pos
+            while True:
+                stop = start
+                while stop < line_end and buf[stop] != 44:
+                    stop += 1
+                if field < len(col_map) and col_map[field] >= 0:
+                    value, status = _parse_double(buf, start, stop)
+                    out[row, col_map[field]] = value
+                    if status == _PARSE_SLOW:
+                        if nslow == len(slow):
+                            grown = np.empty((2 * len(slow), 4), dtype=np.int64)
+                            grown[:nslow] = slow
+                            slow = grown
+                        slow[nslow, 0] = row
+                        slow[nslow, 1] = col_map[field]
+                        slow[nslow, 2] = start
+                        slow[nslow, 3] = stop
+                        nslow += 1
+                field += 1
+                if stop >= line_end:
+                    break
+                start = stop + 1
+            row += 1
+        pos = eol + 1
+
+    return False, out[:row], slow[:nslow]
+
+
+if njit is not None:
+    _parse_decimal = njit(cache=True)(_parse_decimal)
+    _parse_double = njit(cache=True)(_parse_double)
+    _decode_csv = njit(cache=True)(_decode_csv)
+
+
+def _to_oilfield(raw: "np.ndarray") -> "np.ndarray":
+    """Drop sensor-gap rows and convert raw metric columns to oilfield units."""
+    # Non-finite cells count as missing whichever reader parsed them (the
+    # Rust WITS parser rejects inf anyway)
+    raw = np.where(np.isinf(raw), np.nan, raw)
+
+    # Skip all-zero rows (sensor feed gaps); missing counts as zero here
+    gap_cols = [COL.wob, COL.rpm, COL.rop, COL.spp, COL.bit_depth]
+    gap = np.where(np.isnan(raw[:, gap_cols]), 0.0, raw[:, gap_cols])
+    raw = raw[~(np.abs(gap) < 1e-10).all(axis=1)]
+
+    depth = raw[:, COL.bit_depth]
+    hole = raw[:, COL.hole_depth]
+
+    # Convert metric -> oilfield; NaN (missing) passes through every conversion
+    data = np.empty_like(raw)
+    data[:, COL.bit_depth]  = depth * M_TO_FT
+    data[:, COL.hole_depth] = np.where((hole != 0.0) & ~np.isnan(hole), hole, depth) * M_TO_FT
+    data[:, COL.wob]        = raw[:, COL.wob] * KKGF_TO_KLBF
+    data[:, COL.torque]     = raw[:, COL.torque] * KNM_TO_KFTLB
+    data[:, COL.rpm]        = raw[:, COL.rpm]
+    data[:, COL.rop]        = raw[:, COL.rop] * MH_TO_FTHR
+    data[:, COL.hook_load]  = raw[:, COL.hook_load] * KKGF_TO_KLBF
+    data[:, COL.spp]        = raw[:, COL.spp] * KPA_TO_PSI
+    data[:, COL.flow_in]    = raw[:, COL.flow_in] * LMIN_TO_GPM
+    data[:, COL.mw_in]      = raw[:, COL.mw_in] * GCM3_TO_PPG
+    data[:, COL.mw_out]     = raw[:, COL.mw_out] * GCM3_TO_PPG
+    data[:, COL.ecd]        = raw[:, COL.ecd] * GCM3_TO_PPG
+    data[:, COL.temp_in]    = celsius_to_fahrenheit(raw[:, COL.temp_in])
+    data[:, COL.temp_out]   = celsius_to_fahrenheit(raw[:, COL.temp_out])
+    data[:, COL.gas]        = raw[:, COL.gas]
+    data[:, COL.pump_spm]   = raw[:, COL.pump_spm]
+    data[:, COL.pit_volume] = raw[:, COL.pit_volume] * M3_TO_BBL
+    data[:, COL.block_pos]  = raw[:, COL.block_pos] * M_TO_FT
+    return data
 
 
 # ============================================================================
 # TCP Server
 # ============================================================================
 
+# Lag behind the replay schedule that _feed_loop treats as a stalled client
+STALL_SECONDS = 1.0
+
+
+def _format_reading(value: float, spec: str, unit: str = "") -> str:
+    """Format a channel for the progress line; missing (NaN) shows as "-"."""
+    return "-" if np.isnan(value) else f"{value:{spec}}{unit}"
+
+
 class WitsServer:
-    def __init__(self, records: list[WitsRecord], speed: float, port: int, loop_replay: bool):
-        self.records = records
+    def __init__(self, filepath: str, speed: float, port: int, loop_replay: bool,
+                 batch: int = 1, use_cache: bool = True):
+        self.filepath = filepath
+        self.use_cache = use_cache
+        # Filled in by _load() once the well has been parsed
+        self.data = np.empty((0, len(COL)))
+        self.frame_buf, self.frame_offsets = b"", np.zeros(1, dtype=np.int64)
+        self.speed = speed
         self.interval = 1.0 / speed  # seconds between frames
         self.port = port
         self.loop_replay = loop_replay
+        self.batch = max(1, batch)  # records per write/drain
         self.clients: set[asyncio.StreamWriter] = set()
         self.running = True
         self.total_sent = 0
 
     async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         addr = writer.get_extra_info("peername")
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            # Batches are already coalesced; don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         print(f"  [+] Client connected: {addr}")
         self.clients.add(writer)
         try:
@@ -318,30 +801,93 @@ class WitsServer:
             writer.close()
             print(f"  [-] Client disconnected: {addr}")
 
-    async def broadcast(self, data: bytes):
-        """Send data to all connected clients."""
-        dead = []
-        for writer in self.clients:
+    async def broadcast(self, data: bytes | memoryview):
+        """Send data to all connected clients.
+
+        Every client is written first and the drains are awaited together,
+        so a broadcast waits for the slowest client instead of the sum of
+        all of them. data is normally a memoryview slice of the frame
+        buffer, which transports send without an extra copy.
+        """
+        writers = list(self.clients)  # handle_client may edit the set meanwhile
+        results: list = []
+        for writer in writers:
             try:
                 writer.write(data)
-                await writer.drain()
-            except (ConnectionResetError, BrokenPipeError, OSError):
-                dead.append(writer)
-        for w in dead:
-            self.clients.discard(w)
-            w.close()
-
-    async def run(self):
+                results.append(None)
+            except OSError as e:
+                results.append(e)
+
+        if len(writers) == 1:
+            # Common single-consumer case: skip gather's per-call task setup
+            if results[0] is None:
+                try:
+                    await writers[0].drain()
+                except OSError as e:
+                    results[0] = e
+        elif writers:
+            drained = await asyncio.gather(*(w.drain() for w in writers),
+                                           return_exceptions=True)
+            results = [r or d for r, d in zip(results, drained)]
+
+        for w, r in zip(writers, results):
+            if isinstance(r, OSError):
+                self.clients.discard(w)
+                w.close()
+
+    async def run(self) -> bool:
+        """Serve the well; returns False if it has no records to stream."""
         server = await asyncio.start_server(self.handle_client, "0.0.0.0", self.port)
         addr = server.sockets[0].getsockname()
         print(f"\n  WITS Level 0 server listening on {addr[0]}:{addr[1]}")
         print(f"  Connect SAIREN with: cargo run -- --wits-tcp 127.0.0.1:{self.port}")
-        print(f"  Waiting for connection...\n")
-
-        asyncio.create_task(self._feed_loop())
 
         async with server:
+            # Already accepting: clients can connect while the well loads
+            if not await self._load():
+                for writer in list(self.clients):
+                    writer.close()
+                return False
+            if not self.clients:
+                print(f"  Waiting for connection...\n")
+
+            asyncio.create_task(self._feed_loop())
             await server.serve_forever()
+        return True
+
+    async def _load(self) -> bool:
+        """Parse the well and pre-encode its frames in a worker thread."""
+        print(f"\n  Loading CSV...")
+        t0 = time.time()
+        data, cache_hit, (frame_buf, frame_offsets) = await asyncio.to_thread(
+            self._prepare)
+        elapsed = time.time() - t0
+
+        if len(data) == 0:
+            print("Error: No valid records found in CSV.")
+            return False
+
+        # Summary stats
+        depths = data[:, COL.bit_depth]
+        depths = depths[depths > 0]
+        min_depth = depths.min() if len(depths) else 0
+        max_depth = depths.max() if len(depths) else 0
+        duration_at_speed = len(data) / self.speed
+
+        print(f"  Loaded:   {len(data):,} records in {elapsed:.1f}s"
+              f"{' (cached)' if cache_hit else ''}")
+        print(f"  Depth:    {min_depth:.0f} - {max_depth:.0f} ft "
+              f"({min_depth/M_TO_FT:.0f} - {max_depth/M_TO_FT:.0f} m)")
+        print(f"  Duration: {duration_at_speed/3600:.1f} hours at {self.speed}x speed")
+
+        self.data = data
+        self.frame_buf, self.frame_offsets = frame_buf, frame_offsets
+        return True
+
+    def _prepare(self):
+        data, cache_hit = load_well(self.filepath, use_cache=self.use_cache)
+        # Replay cycles the same rows, so every frame is formatted exactly once
+        return data, cache_hit, encode_frames(data)
 
     async def _feed_loop(self):
         """Stream WITS frames to all connected clients at the configured rate."""
@@ -349,7 +895,7 @@ class WitsServer:
         while not self.clients and self.running:
             await asyncio.sleep(0.1)
 
-        print(f"  >>> Streaming {len(self.records):,} records "
+        print(f"  >>> Streaming {len(self.data):,} records "
               f"(interval={self.interval:.3f}s)")
         print()
 
@@ -359,29 +905,55 @@ class WitsServer:
             if pass_num > 1:
                 print(f"\n  >>> Loop pass #{pass_num}")
 
-            for i, rec in enumerate(self.records):
+            frames = memoryview(self.frame_buf)
+            offsets = self.frame_offsets
+            n = len(self.data)
+            loop = asyncio.get_running_loop()
+            # Absolute schedule: record i is due at t0 + i * interval, so
+            # sleep jitter never accumulates into drift
+            t0 = loop.time()
+            i = 0
+            while i < n:
                 if not self.running:
                     return
                 if not self.clients:
-                    # Wait for a client to reconnect
+                    # Wait for a client to reconnect, then resume the schedule
                     while not self.clients and self.running:
                         await asyncio.sleep(0.1)
-
-                frame = rec.to_wits_frame()
-                await self.broadcast(frame)
-                self.total_sent += 1
+                    t0 = loop.time() - i * self.interval
+
+                now = loop.time()
+                lag = now - (t0 + (i + self.batch - 1) * self.interval)
+                if lag > STALL_SECONDS:
+                    # Stalled (blocked drain, suspended process): pause the
+                    # replay like a reconnect rather than bursting the
+                    # backlog, which SAIREN would stamp with one now()
+                    t0 += lag
+
+                # Everything due by now goes out as one contiguous slice; a
+                # late wake catches up at most one batch per write
+                due = int((now - t0) / self.interval) + 1
+                j = min(n, i + self.batch, max(i + 1, due))
+                await self.broadcast(frames[offsets[i]:offsets[j]])
+                prev_sent = self.total_sent
+                self.total_sent += j - i
+                i = j
 
                 # Progress every 1000 records
-                if self.total_sent % 1000 == 0:
-                    depth_str = f"{rec.bit_depth:.0f}ft"
-                    rop_str = f"ROP={rec.rop:.1f}"
-                    wob_str = f"WOB={rec.wob:.1f}"
-                    rpm_str = f"RPM={rec.rpm:.0f}"
+                if self.total_sent // 1000 != prev_sent // 1000:
+                    rec = WitsRecord._make(self.data[i - 1])
+                    depth_str = _format_reading(rec.bit_depth, ".0f", "ft")
+                    rop_str = f"ROP={_format_reading(rec.rop, '.1f')}"
+                    wob_str = f"WOB={_format_reading(rec.wob, '.1f')}"
+                    rpm_str = f"RPM={_format_reading(rec.rpm, '.0f')}"
                     print(f"  [{self.total_sent:>8,}] depth={depth_str:>8s}  "
                           f"{rop_str:>10s}  {wob_str:>9s}  {rpm_str:>7s}  "
                           f"clients={len(self.clients)}")
 
-                await asyncio.sleep(self.interval)
+                # Wake when the next batch is due; sleep(0) when behind still
+                # yields to client handlers
+                deadline = t0 + (i + self.batch - 1) * self.interval
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
 
             if not self.loop_replay:
                 print(f"\n  >>> Replay complete. {self.total_sent:,} records sent.")
@@ -433,6 +1005,11 @@ def main():
                         help="TCP port to listen on (default: 10001)")
     parser.add_argument("--speed", "-s", type=float, default=1.0,
                         help="Playback speed multiplier (default: 1.0 = 1 record/sec)")
+    parser.add_argument("--batch", "-b", type=int, default=None,
+                        help="Records coalesced per socket write "
+                             "(default: max(1, speed/10))")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always parse the CSV; don't read or write its .npy cache")
     parser.add_argument("--loop", action="store_true",
                         help="Loop replay continuously")
     parser.add_argument("--list", action="store_true",
@@ -468,32 +1045,17 @@ def main():
     print(f"  File:     {args.file}")
     print(f"  Port:     {args.port}")
     print(f"  Speed:    {args.speed}x ({1.0/args.speed:.3f}s per record)")
+    if args.batch is None:
+        args.batch = max(1, int(args.speed / 10))
+    print(f"  Batch:    {args.batch} record(s) per write")
     print(f"  Loop:     {'yes' if args.loop else 'no'}")
 
-    print(f"\n  Loading CSV...")
-    t0 = time.time()
-    records = load_csv(args.file)
-    elapsed = time.time() - t0
-
-    if not records:
-        print("Error: No valid records found in CSV.")
-        sys.exit(1)
+    # Run server; the CSV loads in the background once it is listening
+    srv = WitsServer(args.file, args.speed, args.port, args.loop, args.batch,
+                     use_cache=not args.no_cache)
 
-    # Summary stats
-    depths = [r.bit_depth for r in records if r.bit_depth > 0]
-    min_depth = min(depths) if depths else 0
-    max_depth = max(depths) if depths else 0
-    duration_at_speed = len(records) / args.speed
-
-    print(f"  Loaded:   {len(records):,} records in {elapsed:.1f}s")
-    print(f"  Depth:    {min_depth:.0f} - {max_depth:.0f} ft "
-          f"({min_depth/M_TO_FT:.0f} - {max_depth/M_TO_FT:.0f} m)")
-    print(f"  Duration: {duration_at_speed/3600:.1f} hours at {args.speed}x speed")
-
-    # Run server
-    srv = WitsServer(records, args.speed, args.port, args.loop)
-
-    loop = asyncio.new_event_loop()
+    # libuv loop: less Python per socket write than the selector loop
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
 
     def shutdown():
         srv.running = False
@@ -502,12 +1064,15 @@ def main():
     loop.add_signal_handler(signal.SIGINT, shutdown)
     loop.add_signal_handler(signal.SIGTERM, shutdown)
 
+    ok = True
     try:
-        loop.run_until_complete(srv.run())
+        ok = loop.run_until_complete(srv.run())
     except KeyboardInterrupt:
         shutdown()
     finally:
         loop.close()
+    if not ok:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -9,12 +9,16 @@ Example:
 """
 
 import csv
+import io
 import sys
-import xml.etree.ElementTree as ET
 import zipfile
-from collections import defaultdict
 from datetime import datetime, timezone
 
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
 ZIP_PATH = "data/volve/Volve - Real Time drilling data 13.05.2018.zip"
 
 # WITSML mnemonic → Kaggle column name mapping
@@ -84,59 +88,64 @@ MNEMONIC_MAP = {
 
 NS = {"witsml": "http://www.witsml.org/schemas/1series"}
 
+# Namespaced tags as iterparse reports them
+LOG_TAG = f"{{{NS['witsml']}}}log"
+INDEX_TYPE_TAG = f"{{{NS['witsml']}}}indexType"
+CURVE_INFO_TAG = f"{{{NS['witsml']}}}logCurveInfo"
+MNEMONIC_TAG = f"{{{NS['witsml']}}}mnemonic"
+DATA_TAG = f"{{{NS['witsml']}}}data"
+
 
 def parse_witsml_log(xml_bytes):
-    """Parse a WITSML 1.4.1 log XML and return (mnemonic_list, rows).
+    """Parse a WITSML 1.4.1 log XML and return its time-indexed rows.
     Each row is (timestamp_str, {col_index: value_str}).
-    """
-    root = ET.fromstring(xml_bytes)
-    logs = root.findall("witsml:log", NS)
-    if not logs:
-        return []
 
+    The XML is streamed with iterparse (lxml when installed, else
+    ElementTree) and each <data> row is cleared once read, so row text is
+    never all held in memory at once.
+    """
     all_rows = []
-    for log in logs:
-        # Check if time-indexed
-        idx_type = log.findtext("witsml:indexType", "", NS)
-        if "time" not in idx_type.lower():
-            continue
-
-        # Get curve mnemonics
-        curve_infos = log.findall("witsml:logCurveInfo", NS)
-        mnemonics = []
-        for ci in curve_infos:
-            mnem = ci.findtext("witsml:mnemonic", "", NS).strip().upper()
-            mnemonics.append(mnem)
-
-        # Parse data rows
-        log_data = log.find("witsml:logData", NS)
-        if log_data is None:
-            continue
-
-        for data_node in log_data.findall("witsml:data", NS):
-            text = data_node.text
-            if not text:
+    # Per-log state, reset when each </log> closes
+    time_indexed = False
+    mnemonics = []
+    targets = None
+
+    for _, elem in ET.iterparse(io.BytesIO(xml_bytes)):
+        tag = elem.tag
+        if tag == DATA_TAG:
+            text = elem.text
+            elem.clear()
+            if not time_indexed or not text:
                 continue
+            if targets is None:
+                # (position, column) of every mapped curve, resolved once per
+                # log so rows only visit the curves that land in the CSV
+                targets = [(i, MNEMONIC_MAP[mnem]) for i, mnem in enumerate(mnemonics)
+                           if i >= 1 and mnem in MNEMONIC_MAP]
             values = text.split(",")
             if len(values) < 2:
                 continue
 
-            timestamp = values[0].strip()
             row_data = {}
-            for i, val in enumerate(values[1:], 1):
-                val = val.strip()
-                if not val:
+            for i, col_idx in targets:
+                if i >= len(values):
+                    break
+                if col_idx in row_data:
                     continue
-                if i < len(mnemonics):
-                    mnem = mnemonics[i]
-                else:
-                    continue
-                col_idx = MNEMONIC_MAP.get(mnem)
-                if col_idx is not None and col_idx not in row_data:
+                val = values[i].strip()
+                if val:
                     row_data[col_idx] = val
 
             if row_data:
-                all_rows.append((timestamp, row_data))
+                all_rows.append((values[0].strip(), row_data))
+        elif tag == CURVE_INFO_TAG:
+            mnemonics.append(elem.findtext(MNEMONIC_TAG, "").strip().upper())
+            elem.clear()
+        elif tag == INDEX_TYPE_TAG:
+            # Check if time-indexed
+            time_indexed = "time" in (elem.text or "").lower()
+        elif tag == LOG_TAG:
+            time_indexed, mnemonics, targets = False, [], None
 
     return all_rows
 
@@ -178,43 +187,36 @@ def main():
         print("No time-indexed data found!")
         sys.exit(1)
 
-    # Sort by timestamp
-    all_rows.sort(key=lambda r: r[0])
-
-    # Merge rows with same timestamp
-    merged = defaultdict(dict)
-    ts_order = []
+    # Merge rows with same timestamp straight into output rows. Values are
+    # never blank, so an empty cell means "not set yet"; merging in file
+    # order keeps the first value per column, and only the unique
+    # timestamps need sorting afterwards.
+    blank = [""] * (len(KAGGLE_HEADER) - 1)
+    merged = {}
     for ts, data in all_rows:
-        if ts not in merged:
-            ts_order.append(ts)
+        row = merged.get(ts)
+        if row is None:
+            merged[ts] = row = [ts, *blank]
         for col_idx, val in data.items():
-            if col_idx not in merged[ts]:
-                merged[ts][col_idx] = val
+            if not row[col_idx]:
+                row[col_idx] = val
+    rows = [merged[ts] for ts in sorted(merged)]
 
-    print(f"\nTotal unique timestamps: {len(ts_order)}")
+    print(f"\nTotal unique timestamps: {len(rows)}")
 
     # Write CSV
     with open(output_path, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(KAGGLE_HEADER)
+        writer.writerows(rows)
 
-        rows_written = 0
-        for ts in ts_order:
-            row = [ts] + [""] * (len(KAGGLE_HEADER) - 1)
-            data = merged[ts]
-            for col_idx, val in data.items():
-                if col_idx < len(row):
-                    row[col_idx] = val
-            writer.writerow(row)
-            rows_written += 1
-
-    print(f"Wrote {rows_written} rows to {output_path}")
+    print(f"Wrote {len(rows)} rows to {output_path}")
 
     # Quick stats
-    has_wob = sum(1 for ts in ts_order if 3 in merged[ts])
-    has_rpm = sum(1 for ts in ts_order if 5 in merged[ts])
-    has_rop = sum(1 for ts in ts_order if 6 in merged[ts])
-    has_spp = sum(1 for ts in ts_order if 7 in merged[ts])
+    has_wob = sum(1 for row in rows if row[3])
+    has_rpm = sum(1 for row in rows if row[5])
+    has_rop = sum(1 for row in rows if row[6])
+    has_spp = sum(1 for row in rows if row[7])
     print(f"Coverage: WOB={has_wob}, RPM={has_rpm}, ROP={has_rop}, SPP={has_spp}")
 
 